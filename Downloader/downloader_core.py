@@ -1,11 +1,164 @@
 import os
+import re
+import socket
+import queue
+import shutil
 import threading
-import requests
-import yt_dlp
-from urllib.parse import urlparse
+import time
+import functools
+import importlib.util
+import concurrent.futures
+from urllib.parse import unquote
+
+# yt_dlp, requests, aiohttp and asyncio are imported where they are used: yt_dlp alone loads
+# hundreds of extractor modules, which would otherwise delay every app start.
+
+CHUNK_SIZE = 1 << 18 # 256 KiB per read keeps the copy loop out of Python overhead
+PROGRESS_STEP = 1 << 19 # Report progress every 512 KiB instead of every chunk
+PROGRESS_INTERVAL = 0.1 # At most 10 progress reports per second reach the UI
+COPY_BUFFER_SIZE = 1 << 20 # Buffer for the progress-free shutil.copyfileobj path
+WRITE_BUFFER_SIZE = 1 << 20 # Batch several network chunks into each write() syscall
+MAX_CONCURRENT_DOWNLOADS = 4 # Downloads are network-bound, so a few can run side by side
+
+# Last path segment with a 2-5 character extension. The lookbehind skips the "//host" part of the URL.
+_FILENAME_RE = re.compile(r'(?<=[^/:])/([^/?#]+\.[A-Za-z0-9]{2,5})(?:[?#]|$)')
+# filename*=charset'lang'percent-encoded-value (RFC 5987) or a plain quoted/token filename=
+_CONTENT_DISPOSITION_RE = re.compile(
+    r"""filename\*\s*=\s*"?(?P<charset>[^'";\s]*)'[^']*'(?P<value>[^;\s"]+)"?"""
+    r"""|filename\s*=\s*(?:"(?P<quoted>[^"]*)"|(?P<token>[^;\s]+))""",
+    re.IGNORECASE)
+# Characters Windows doesn't allow in filenames (":" would also create an NTFS stream), plus controls
+_INVALID_FILENAME_CHARS_RE = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+# Device names Windows reserves whatever the extension
+_RESERVED_FILENAMES = frozenset(["CON", "PRN", "AUX", "NUL"]
+                                + [f"COM{i}" for i in range(1, 10)] + [f"LPT{i}" for i in range(1, 10)])
+
+def _content_disposition_filename(header):
+    """Returns the filename from a Content-Disposition header, preferring filename*= over filename=."""
+    plain = None
+    for match in _CONTENT_DISPOSITION_RE.finditer(header):
+        if match.group('value') is not None:
+            # Only the extended form is percent-encoded (RFC 6266)
+            try:
+                return unquote(match.group('value'), encoding=match.group('charset') or 'utf-8')
+            except LookupError: # Unknown charset
+                return unquote(match.group('value'))
+        if plain is None:
+            plain = match.group('quoted') if match.group('quoted') is not None else match.group('token')
+    return plain
+
+def _safe_filename(name):
+    """Reduces a server-supplied name to a bare filename that is valid on Windows, or returns None."""
+    name = os.path.basename(name.replace('\\', '/')) # Never trust directories in a server-supplied name
+    name = _INVALID_FILENAME_CHARS_RE.sub('_', name).rstrip('. ') # Windows drops trailing dots and spaces
+    if not name or name.split('.')[0].rstrip().upper() in _RESERVED_FILENAMES:
+        return None
+    return name
+
+def _image_filename(url, content_disposition=None):
+    """Picks a filename from the Content-Disposition header, then the URL, then a generic default."""
+    if content_disposition:
+        filename = _content_disposition_filename(content_disposition)
+        if filename:
+            filename = _safe_filename(filename)
+            if filename:
+                return filename
+    match = _FILENAME_RE.search(url)
+    filename = _safe_filename(match.group(1)) if match else None
+    return filename or "downloaded_image.jpg" # Default to JPG
+
+# yt-dlp format selector for each (download_type, quality). Unknown qualities fall back to "best".
+_FORMATS = {
+    ('video', 'best'): 'bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best',
+    # Example: Prioritize 720p or 480p if available
+    ('video', 'medium'): 'bestvideo[height<=720][ext=mp4]+bestaudio[ext=m4a]/bestvideo[height<=480][ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best',
+    # Example: Prioritize 360p or 240p
+    ('video', 'low'): 'bestvideo[height<=360][ext=mp4]+bestaudio[ext=m4a]/bestvideo[height<=240][ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best',
+    # For audio, quality usually refers to bitrate
+    ('audio', 'best'): 'bestaudio/best',
+    ('audio', 'medium'): 'bestaudio[abr<=192]/best', # Example: up to 192kbps
+    ('audio', 'low'): 'bestaudio[abr<=128]/best', # Example: up to 128kbps
+}
+
+# Socket options for pooled connections: no Nagle delay and keep-alive. SO_RCVBUF is left
+# alone: Windows, macOS and Linux all autotune the receive window, and setting a fixed buffer
+# turns that off on each of them.
+_SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+def _build_session():
+    """
+    Creates the requests session used for image downloads, with pooled, retrying and
+    socket-tuned connections.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    class TunedAdapter(HTTPAdapter):
+        def init_poolmanager(self, *args, **kwargs):
+            kwargs['socket_options'] = _SOCKET_OPTIONS
+            super().init_poolmanager(*args, **kwargs)
+
+    session = requests.Session()
+    adapter = TunedAdapter(
+        pool_connections=8,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+class _ProgressReporter:
+    """
+    Throttled progress reports for one image download, in yt-dlp's progress dict format.
+    Reports go out at most every PROGRESS_STEP bytes and PROGRESS_INTERVAL seconds, plus a
+    final one with the actual size, which can differ from Content-Length for compressed bodies.
+    """
+    def __init__(self, callback, total_size):
+        self.callback = callback
+        self.inv_total = 100.0 / total_size
+        self.last_reported = 0
+        self.last_report_t = 0.0
+        # Simulate yt-dlp progress dict for consistency. It is updated in place for every report.
+        self.progress = {
+            'status': 'downloading',
+            'total_bytes': total_size,
+            'downloaded_bytes': 0,
+            '_percent_str': '0.0%',
+            '_downloaded_bytes_str': '0 MiB',
+            '_total_bytes_str': f"{total_size / (1024*1024):.2f} MiB",
+            '_speed_str': 'N/A', # Requests doesn't provide speed easily
+            '_eta_str': 'N/A', # Requests doesn't provide ETA easily
+        }
+
+    def update(self, downloaded_size):
+        """Reports downloaded_size if enough bytes and time have passed since the last report."""
+        if downloaded_size - self.last_reported >= PROGRESS_STEP:
+            now = time.monotonic()
+            if now - self.last_report_t >= PROGRESS_INTERVAL:
+                self.last_report_t = now
+                self._report(downloaded_size)
+
+    def finish(self, downloaded_size):
+        """Reports the final size unless the last report already did."""
+        if downloaded_size != self.last_reported:
+            self._report(downloaded_size)
+
+    def _report(self, downloaded_size):
+        """Refreshes the progress dict and hands it to the progress callback."""
+        self.last_reported = downloaded_size
+        progress = self.progress
+        progress['downloaded_bytes'] = downloaded_size
+        progress['_downloaded_bytes_str'] = f"{downloaded_size / (1024*1024):.2f} MiB"
+        progress['_percent_str'] = f"{downloaded_size * self.inv_total:.1f}%"
+        self.callback(progress)
 
 class DownloadManager:
-    def __init__(self, progress_callback=None, completion_callback=None, error_callback=None):
+    def __init__(self, progress_callback=None, completion_callback=None, error_callback=None, use_async=False):
         """
         Initializes the DownloadManager.
 
@@ -17,59 +170,141 @@ class DownloadManager:
                                                       Expected signature: completion_callback(file_path)
             error_callback (callable, optional): A function to call when an error occurs during download.
                                                  Expected signature: error_callback(message)
+            use_async (bool, optional): Download images with aiohttp on a shared background event loop
+                                        instead of the thread pool. Ignored if aiohttp is not installed.
         """
         self.progress_callback = progress_callback
         self.completion_callback = completion_callback
         self.error_callback = error_callback
-        self.is_downloading = False # Flag to indicate if a download is in progress
         self.download_quality = "best" # Default download quality
 
+        # Shared HTTP session so repeated image downloads reuse pooled TCP/TLS connections.
+        # Built on the first image download.
+        self._session = None
+
+        # Long-lived workers fed from a queue; the same URL is never fetched twice at once
+        self._work_queue = queue.Queue()
+        self._inflight = set() # Futures that are queued or running
+        self._active_urls = set()
+        self._lock = threading.Lock()
+        self._closed = False # Set by shutdown(); no new downloads are accepted after that
+        self._workers = []
+        for _ in range(MAX_CONCURRENT_DOWNLOADS):
+            worker = threading.Thread(target=self._worker_loop, daemon=True) # Never block app exit on a download
+            worker.start()
+            self._workers.append(worker)
+
+        # Async image downloads: one event loop thread and one aiohttp session, created on first use
+        self.use_async = use_async and importlib.util.find_spec("aiohttp") is not None
+        self._loop = None
+        self._aio_session = None
+
+    @property
+    def is_downloading(self):
+        """True while any download is queued or running."""
+        return bool(self._inflight)
+
+    def close(self):
+        """Releases the pooled HTTP connections held by the manager."""
+        if self._session is not None:
+            self._session.close()
+        if self._loop is not None:
+            if self._aio_session is not None:
+                try:
+                    self._run_on_event_loop(self._aio_session.close()).result(timeout=5)
+                except concurrent.futures.TimeoutError:
+                    pass # Don't hold up app exit; the loop thread is a daemon
+            self._loop.call_soon_threadsafe(self._loop.stop)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+    def shutdown(self, wait=True):
+        """
+        Cancels queued downloads, stops the worker threads and releases all connections.
+
+        Args:
+            wait (bool, optional): Block until downloads that are already running have finished.
+        """
+        with self._lock:
+            self._closed = True
+        self.cancel_all()
+        for _ in self._workers:
+            self._work_queue.put(None) # One stop sentinel per worker
+        if wait:
+            for worker in self._workers:
+                worker.join()
+        self.close()
+
+    def _worker_loop(self):
+        """Runs queued download tasks until a stop sentinel is received."""
+        while True:
+            task = self._work_queue.get()
+            try:
+                if task is None:
+                    return
+                future, args = task
+                if future.set_running_or_notify_cancel(): # False if cancelled while queued
+                    try:
+                        self._run_download_task(*args)
+                    except Exception as e:
+                        future.set_exception(e)
+                    else:
+                        future.set_result(None)
+            finally:
+                self._work_queue.task_done()
+
+    def _get_session(self):
+        """Returns the shared requests session, creating it on first use."""
+        with self._lock:
+            if self._session is None:
+                self._session = _build_session()
+            return self._session
+
     def set_download_quality(self, quality):
         """Sets the desired download quality."""
         self.download_quality = quality
 
-    def _yt_dlp_hook(self, d):
+    def _new_yt_dlp_hook(self):
         """
-        Callback hook for yt-dlp to report download progress.
+        Returns a hook for yt-dlp to report download progress. Each download gets its own hook,
+        rate-limited to one report per PROGRESS_INTERVAL, so downloads running side by side
+        don't use up each other's budget. Reports other than 'downloading' always go through.
         """
-        if self.progress_callback:
+        last_report_t = 0.0
+
+        def hook(d):
+            nonlocal last_report_t
+            if not self.progress_callback:
+                return
+            now = time.monotonic()
+            if d['status'] == 'downloading' and now - last_report_t < PROGRESS_INTERVAL:
+                return
+            last_report_t = now
             self.progress_callback(d)
+        return hook
 
     def _download_video_audio(self, url, output_path, download_type):
         """
         Uses yt-dlp to download video or extract audio.
         """
+        import yt_dlp
+
         # Define format based on download_type and selected quality
-        format_string = ""
-        if download_type == 'video':
-            if self.download_quality == "best":
-                format_string = 'bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best'
-            elif self.download_quality == "medium":
-                # Example: Prioritize 720p or 480p if available
-                format_string = 'bestvideo[height<=720][ext=mp4]+bestaudio[ext=m4a]/bestvideo[height<=480][ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best'
-            elif self.download_quality == "low":
-                # Example: Prioritize 360p or 240p
-                format_string = 'bestvideo[height<=360][ext=mp4]+bestaudio[ext=m4a]/bestvideo[height<=240][ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best'
-            else: # Fallback to best if unknown quality
-                format_string = 'bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best'
-        elif download_type == 'audio':
-            # For audio, quality usually refers to bitrate
-            if self.download_quality == "best":
-                format_string = 'bestaudio/best'
-            elif self.download_quality == "medium":
-                format_string = 'bestaudio[abr<=192]/best' # Example: up to 192kbps
-            elif self.download_quality == "low":
-                format_string = 'bestaudio[abr<=128]/best' # Example: up to 128kbps
-            else:
-                format_string = 'bestaudio/best'
+        format_string = _FORMATS.get((download_type, self.download_quality)) or _FORMATS[(download_type, 'best')]
 
         ydl_opts = {
             'outtmpl': os.path.join(output_path, '%(title)s.%(ext)s'),
-            'progress_hooks': [self._yt_dlp_hook],
+            'progress_hooks': [self._new_yt_dlp_hook()],
             'retries': 3,
             'fragment_retries': 3,
-            'ignoreerrors': True, # Continue on errors if possible
             'format': format_string,
+            'concurrent_fragment_downloads': 5, # Fetch HLS/DASH fragments in parallel
+            'http_chunk_size': 10 * 1024 * 1024, # Fewer, larger ranged GETs for plain HTTP downloads
+            'noprogress': False, # Keep the progress hook firing with aggregate progress
         }
 
         if download_type == 'audio':
@@ -106,89 +341,179 @@ class DownloadManager:
         except Exception as e:
             if self.error_callback:
                 self.error_callback(f"An unexpected error occurred downloading {url}: {e}")
-        finally:
-            self.is_downloading = False
 
 
     def _download_image(self, url, output_path):
         """
         Downloads an image using the requests library.
         """
+        import requests
+        import urllib3
+
         try:
-            response = requests.get(url, stream=True, timeout=10)
+            response = self._get_session().get(url, stream=True, timeout=10)
             response.raise_for_status() # Raise an exception for HTTP errors
+            response.raw.decode_content = True # Let urllib3 undo gzip/deflate when reading raw
 
-            # Infer filename from URL or use a generic one
-            parsed_url = urlparse(url)
-            filename = os.path.basename(parsed_url.path)
-            if not filename or '.' not in filename: # If no filename or no extension
-                filename = "downloaded_image.jpg" # Default to JPG
-            elif len(filename.split('.')[-1]) > 5: # If extension looks too long, might not be one
-                 filename = filename.split('.')[0] + ".jpg" # Force .jpg
-
+            filename = _image_filename(url, response.headers.get('content-disposition'))
             file_path = os.path.join(output_path, filename)
 
             total_size = int(response.headers.get('content-length', 0))
-            downloaded_size = 0
-
-            with open(file_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if not chunk:
-                        continue
-                    f.write(chunk)
-                    downloaded_size += len(chunk)
-                    if self.progress_callback:
-                        # Simulate yt-dlp progress dict for consistency
-                        # yt-dlp uses _total_bytes_str, _downloaded_bytes_str, _percent_str, _speed_str, _eta_str
-                        # We'll calculate these for requests
-                        percent_str = f"{downloaded_size / total_size * 100:.1f}%" if total_size > 0 else "N/A%"
-                        downloaded_bytes_str = f"{downloaded_size / (1024*1024):.2f} MiB" if downloaded_size > 0 else "0 MiB"
-                        total_bytes_str = f"{total_size / (1024*1024):.2f} MiB" if total_size > 0 else "N/A MiB"
-
-                        self.progress_callback({
-                            'status': 'downloading',
-                            'total_bytes': total_size,
-                            'downloaded_bytes': downloaded_size,
-                            '_percent_str': percent_str,
-                            '_downloaded_bytes_str': downloaded_bytes_str,
-                            '_total_bytes_str': total_bytes_str,
-                            '_speed_str': 'N/A', # Requests doesn't provide speed easily
-                            '_eta_str': 'N/A', # Requests doesn't provide ETA easily
-                        })
+
+            with open(file_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                if self.progress_callback and total_size > 0:
+                    self._copy_with_progress(response, f, total_size)
+                else:
+                    # No meaningful per-chunk progress to report, so let the C copy loop do the work
+                    shutil.copyfileobj(response.raw, f, length=COPY_BUFFER_SIZE)
             if self.completion_callback:
                 self.completion_callback(file_path)
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
+            # Reading response.raw directly raises urllib3's own errors for mid-stream failures
             if self.error_callback:
                 self.error_callback(f"Network error downloading image from {url}: {e}")
         except Exception as e:
             if self.error_callback:
                 self.error_callback(f"Error downloading image from {url}: {e}")
-        finally:
-            self.is_downloading = False
+
+    def _copy_with_progress(self, response, f, total_size):
+        """
+        Streams the response body into f, reporting progress through a _ProgressReporter.
+        """
+        reporter = _ProgressReporter(self.progress_callback, total_size)
+        downloaded_size = 0
+        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+            if not chunk:
+                continue
+            f.write(chunk)
+            downloaded_size += len(chunk)
+            reporter.update(downloaded_size)
+        reporter.finish(downloaded_size)
+
+    def _run_on_event_loop(self, coro):
+        """Schedules coro on the background asyncio loop, starting the loop on first use."""
+        import asyncio
+
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def _get_aio_session(self):
+        """Returns the shared aiohttp session. Must be called on the event loop thread."""
+        import aiohttp
+
+        if self._aio_session is None:
+            connector = aiohttp.TCPConnector(limit=32, limit_per_host=8, ttl_dns_cache=300)
+            timeout = aiohttp.ClientTimeout(sock_connect=10, sock_read=10)
+            self._aio_session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        return self._aio_session
+
+    async def _download_image_async(self, url, output_path):
+        """
+        Downloads an image using the shared aiohttp session.
+        """
+        import aiohttp
+
+        try:
+            async with self._get_aio_session().get(url) as response:
+                response.raise_for_status() # Raise an exception for HTTP errors
+
+                filename = _image_filename(url, response.headers.get('content-disposition'))
+                file_path = os.path.join(output_path, filename)
+                total_size = response.content_length or 0
+                reporter = None
+                if self.progress_callback and total_size > 0:
+                    reporter = _ProgressReporter(self.progress_callback, total_size)
+                downloaded_size = 0
+
+                with open(file_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                    async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                        f.write(chunk)
+                        downloaded_size += len(chunk)
+                        if reporter:
+                            reporter.update(downloaded_size)
+                if reporter:
+                    reporter.finish(downloaded_size)
+            if self.completion_callback:
+                self.completion_callback(file_path)
+        except aiohttp.ClientError as e:
+            if self.error_callback:
+                self.error_callback(f"Network error downloading image from {url}: {e}")
+        except Exception as e:
+            if self.error_callback:
+                self.error_callback(f"Error downloading image from {url}: {e}")
+
+    async def _run_async_task(self, future, url, output_dir):
+        """Runs an async image download for future, unless it was cancelled while waiting for the loop."""
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            await self._download_image_async(url, output_dir)
+        except Exception as e:
+            future.set_exception(e)
+        else:
+            future.set_result(None)
 
     def download_content(self, url, download_type, output_dir):
         """
-        Starts the download in a separate thread.
+        Queues the download on the worker pool.
 
         Args:
             url (str): The URL to download.
             download_type (str): 'video', 'audio', or 'image'.
             output_dir (str): The directory to save the downloaded content.
-        """
-        if self.is_downloading:
-            if self.error_callback:
-                self.error_callback("A download is already in progress. Please wait.")
-            return
 
+        Returns:
+            concurrent.futures.Future: Tracks the download, or None if it was rejected.
+        """
         if not os.path.isdir(output_dir):
             if self.error_callback:
                 self.error_callback(f"Output directory does not exist: {output_dir}")
-            return
+            return None
+
+        rejection = None
+        with self._lock:
+            if self._closed:
+                rejection = "The download manager has been shut down."
+            elif url in self._active_urls:
+                rejection = f"{url} is already being downloaded. Please wait."
+            else:
+                self._active_urls.add(url)
+                # Async downloads get the same kind of Future as queued ones (rather than the one from
+                # run_coroutine_threadsafe), so once running they can't be cancelled halfway through a file
+                future = concurrent.futures.Future()
+                if download_type == 'image' and self.use_async:
+                    self._run_on_event_loop(self._run_async_task(future, url, output_dir))
+                else:
+                    self._work_queue.put((future, (url, download_type, output_dir)))
+                self._inflight.add(future)
+        if rejection is not None:
+            # Reported outside the lock, so the callback may call back into the manager
+            if self.error_callback:
+                self.error_callback(rejection)
+            return None
+        future.add_done_callback(functools.partial(self._on_task_done, url))
+        return future
+
+    def _on_task_done(self, url, future):
+        """Forgets a finished (or cancelled) download so its URL can be fetched again."""
+        with self._lock:
+            self._inflight.discard(future)
+            self._active_urls.discard(url)
+
+    def wait_all(self, timeout=None):
+        """Blocks until every queued and running download has finished."""
+        with self._lock:
+            pending = list(self._inflight)
+        concurrent.futures.wait(pending, timeout=timeout)
 
-        self.is_downloading = True
-        thread = threading.Thread(target=self._run_download_task, args=(url, download_type, output_dir))
-        thread.daemon = True # Allow the main program to exit even if thread is running
-        thread.start()
+    def cancel_all(self):
+        """Cancels downloads that have not started yet. Running downloads are left to finish."""
+        with self._lock:
+            pending = list(self._inflight)
+        for future in pending:
+            future.cancel()
 
     def _run_download_task(self, url, download_type, output_dir):
         """Internal method to run the actual download task."""
@@ -199,7 +524,6 @@ class DownloadManager:
         else:
             if self.error_callback:
                 self.error_callback(f"Invalid download type: {download_type}")
-            self.is_downloading = False
 
 # Example usage (for testing purposes, not part of the main app)
 if __name__ == '__main__':
@@ -2,10 +2,118 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import os
 import threading
-import json # For saving/loading settings
+import queue
+import collections
 from downloader_core import DownloadManager # Import the DownloadManager
 from PIL import Image, ImageTk # Import Pillow for icons
 
+# Settings are stored as JSON. orjson is used when installed; both paths work on bytes.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=4).encode()
+
+MAX_LOG_LINES = 2000 # Older log lines are dropped so the log doesn't grow for the whole session
+
+# Colors of a UI theme. Fields are read as attributes, which is cheaper than string-keyed dict lookups.
+Theme = collections.namedtuple("Theme", [
+    "bg_app", "bg_frame", "bg_accent", "text_primary", "text_light", "button_primary",
+    "button_hover", "success", "error", "border", "input_bg", "log_bg",
+])
+
+def _build_light_theme():
+    return Theme(
+        bg_app="#e8f0f7",      # Very light blue-gray for main window
+        bg_frame="#dbe9f5",     # Slightly darker for frames
+        bg_accent="#c3d9eb",       # Even darker for some accents
+        text_primary="#2c3e50",     # Dark blue-gray for main text
+        text_light="#ffffff",    # White for text on dark backgrounds
+        button_primary="#3498db",  # Standard blue for buttons/accents
+        button_hover="#2980b9", # Darker blue for hover
+        success="#2ecc71", # Green for success/progress
+        error="#e74c3c",     # Red for errors
+        border="#a7b8c9",  # Soft border color
+        input_bg="#ffffff",      # White for input fields
+        log_bg="#fdfefe",        # Off-white for log background
+    )
+
+def _build_dark_theme():
+    return Theme(
+        bg_app="#2c3e50",      # Dark blue-gray for main window
+        bg_frame="#34495e",     # Slightly lighter for frames
+        bg_accent="#4a627a",       # Even lighter for some accents
+        text_primary="#ecf0f1",     # Light gray for main text
+        text_light="#ffffff",    # White for text on dark backgrounds
+        button_primary="#3498db",  # Standard blue for buttons/accents
+        button_hover="#2980b9", # Darker blue for hover
+        success="#2ecc71", # Green for success/progress
+        error="#e74c3c",     # Red for errors
+        border="#1a242c",  # Dark border color
+        input_bg="#3f546a",      # Darker input fields
+        log_bg="#3f546a",        # Darker log background
+    )
+
+# Themes are only built when they are first applied
+_THEME_FACTORIES = {"light": _build_light_theme, "dark": _build_dark_theme}
+
+class _IconCache(dict):
+    """
+    Icon lookup that opens and resizes each PNG the first time it is requested, so icons
+    that are never shown (e.g. success/error) are never decoded. PNGs that already have
+    the default size are loaded natively by Tk. Icons that fail to load are cached as None.
+    """
+    def __init__(self, icons_dir, sizes, default_size):
+        super().__init__()
+        self.icons_dir = icons_dir
+        self.sizes = sizes
+        self.default_size = default_size
+
+    def __missing__(self, name):
+        path = os.path.join(self.icons_dir, f"{name}.png")
+        size = self.sizes.get(name)
+        if size is None:
+            # Icons generated at the display size are read by Tk's own PNG loader, skipping the
+            # PIL decode/resize/convert round trip. Anything else falls through to PIL below.
+            try:
+                icon = tk.PhotoImage(file=path)
+                if (icon.width(), icon.height()) == self.default_size:
+                    self[name] = icon
+                    return icon
+            except tk.TclError:
+                pass
+        try:
+            # PhotoImage copies the pixels into Tk, so the PIL images are closed right away
+            # instead of keeping their file handles and decoder buffers alive until GC
+            with Image.open(path) as src:
+                if size:
+                    with src.resize(size, Image.Resampling.LANCZOS) as resized: # Large icons keep the high-quality filter
+                        icon = ImageTk.PhotoImage(resized)
+                else:
+                    # BILINEAR looks the same at 24x24 for a fraction of LANCZOS' cost; thumbnail()
+                    # works in place and skips images that are already small enough
+                    src.thumbnail(self.default_size, Image.Resampling.BILINEAR)
+                    icon = ImageTk.PhotoImage(src)
+        except Exception as e:
+            print(f"Error loading icon {name}: {e}")
+            icon = None # Or a default blank image if you have one
+        self[name] = icon
+        return icon
+
+    def get(self, name, default=None):
+        # dict.get() bypasses __missing__, so route lookups through it
+        icon = self[name]
+        return default if icon is None else icon
+
 class DownloaderApp:
     def __init__(self, master):
         self.master = master
@@ -26,38 +134,15 @@ class DownloaderApp:
 
         # --- Settings Variables ---
         self.settings_file = "downloader_settings.json"
+        self._settings_dirty = False # Changes are batched into one write, at most every 500 ms
+        self._settings_flush_pending = False
         self.current_theme = tk.StringVar(value="light") # Default theme
         self.download_quality_var = tk.StringVar(value="best") # Default quality
-        self.themes = {
-            "light": {
-                "bg_app": "#e8f0f7",      # Very light blue-gray for main window
-                "bg_frame": "#dbe9f5",     # Slightly darker for frames
-                "bg_accent": "#c3d9eb",       # Even darker for some accents
-                "text_primary": "#2c3e50",     # Dark blue-gray for main text
-                "text_light": "#ffffff",    # White for text on dark backgrounds
-                "button_primary": "#3498db",  # Standard blue for buttons/accents
-                "button_hover": "#2980b9", # Darker blue for hover
-                "success": "#2ecc71", # Green for success/progress
-                "error": "#e74c3c",     # Red for errors
-                "border": "#a7b8c9",  # Soft border color
-                "input_bg": "#ffffff",      # White for input fields
-                "log_bg": "#fdfefe",        # Off-white for log background
-            },
-            "dark": {
-                "bg_app": "#2c3e50",      # Dark blue-gray for main window
-                "bg_frame": "#34495e",     # Slightly lighter for frames
-                "bg_accent": "#4a627a",       # Even lighter for some accents
-                "text_primary": "#ecf0f1",     # Light gray for main text
-                "text_light": "#ffffff",    # White for text on dark backgrounds
-                "button_primary": "#3498db",  # Standard blue for buttons/accents
-                "button_hover": "#2980b9", # Darker blue for hover
-                "success": "#2ecc71", # Green for success/progress
-                "error": "#e74c3c",     # Red for errors
-                "border": "#1a242c",  # Dark border color
-                "input_bg": "#3f546a",      # Darker input fields
-                "log_bg": "#3f546a",        # Darker log background
-            }
-        }
+        self._theme_cache = {} # Realized Theme per name, see _get_theme()
+        # Style settings per theme (built on first use), and the options currently applied to the ttk style
+        self._style_specs = {}
+        self._style = None
+        self._applied_spec = {}
         self.load_settings() # Load settings before creating widgets
 
         # Load icons (ensure icon_generate.py has been run)
@@ -67,29 +152,63 @@ class DownloaderApp:
             master.iconphoto(True, self.icons["app_icon"])
 
         self.create_menu() # Create menu bar
-        self.create_widgets()
-        self.apply_styles() # Apply styles after widgets are created and settings loaded
+        # Paint the bare window right away; the widgets and styles are filled in once Tk is idle
+        master.configure(bg=self._get_theme(self.current_theme.get()).bg_app)
+        master.update_idletasks()
+        master.after_idle(self._finish_init)
 
         # Add a variable to track the last logged percentage to avoid duplicate log entries
         self._last_logged_percent = -1 
+        # Download threads never touch Tk: their callbacks put (handler, argument) pairs on this
+        # queue and a single GUI timer drains it, so bursts of events never flood the Tk event queue
+        self._gui_queue = queue.Queue()
+        self._log_buffer = collections.deque() # (line, tag) pairs not yet written to log_text
         self.download_manager.set_download_quality(self.download_quality_var.get()) # Set initial quality in manager
+        master.protocol("WM_DELETE_WINDOW", self._on_close) # Release download workers on exit
+
+    def _finish_init(self):
+        """Builds the widgets and applies the theme after the first paint, then starts the GUI pump."""
+        self.create_widgets()
+        self.apply_styles() # Apply styles after widgets are created and settings loaded
+        self.master.after(33, self._pump_gui_queue)
 
+    def _on_close(self):
+        """Writes pending settings, stops the download workers without waiting for running downloads, then closes the window."""
+        self._flush_settings()
+        self.download_manager.shutdown(wait=False)
+        self.master.destroy()
 
     def load_settings(self):
         """Loads application settings from a JSON file."""
         try:
-            if os.path.exists(self.settings_file):
-                with open(self.settings_file, "r") as f:
-                    settings = json.load(f)
-                    self.current_theme.set(settings.get("theme", "light"))
-                    self.download_quality_var.set(settings.get("download_quality", "best"))
-                    saved_dir = settings.get("output_directory")
-                    if saved_dir and os.path.isdir(saved_dir):
-                        self.output_directory = saved_dir
+            # One open+read of the raw bytes; a missing file is the common first-run case
+            with open(self.settings_file, "rb") as f:
+                settings = _json_loads(f.read())
+            self.current_theme.set(settings.get("theme", "light"))
+            self.download_quality_var.set(settings.get("download_quality", "best"))
+            saved_dir = settings.get("output_directory")
+            if saved_dir and os.path.isdir(saved_dir):
+                self.output_directory = saved_dir
+        except FileNotFoundError:
+            pass # No settings saved yet, keep the defaults
         except Exception as e:
             print(f"Error loading settings: {e}")
             # Fallback to defaults
 
+    def _mark_settings_dirty(self):
+        """Schedules a settings write, so a burst of changes costs one write instead of one each."""
+        self._settings_dirty = True
+        if not self._settings_flush_pending:
+            self._settings_flush_pending = True
+            self.master.after(500, self._flush_settings)
+
+    def _flush_settings(self):
+        """Writes the settings file if anything changed since the last write."""
+        self._settings_flush_pending = False
+        if self._settings_dirty:
+            self._settings_dirty = False
+            self.save_settings()
+
     def save_settings(self):
         """Saves current application settings to a JSON file."""
         settings = {
@@ -98,39 +217,22 @@ class DownloaderApp:
             "output_directory": self.output_directory
         }
         try:
-            with open(self.settings_file, "w") as f:
-                json.dump(settings, f, indent=4)
+            data = _json_dumps(settings)
+            with open(self.settings_file, "wb") as f:
+                f.write(data)
         except Exception as e:
             print(f"Error saving settings: {e}")
 
     def _load_icons(self):
-        """Loads icon images from the 'icons' directory."""
-        icon_names = [
-            "app_icon", "paste_icon", "browse_icon", "download_icon",
-            "video_icon", "audio_icon", "image_icon", "settings_icon",
-            "help_icon", "info_icon", "success_icon", "error_icon",
-            "light_theme_icon", "dark_theme_icon" # New theme icons
-        ]
+        """Prepares the icons from the 'icons' directory. Each icon is decoded the first time it is used."""
         icons_dir = "icons"
         
         if not os.path.exists(icons_dir):
             messagebox.showerror("Icon Error", f"The 'icons' directory was not found at '{icons_dir}'. Please run 'icon_generate.py' first to create the icons.")
             return
 
-        for name in icon_names:
-            path = os.path.join(icons_dir, f"{name}.png")
-            try:
-                img = Image.open(path)
-                # Resize icons for buttons (e.g., 24x24 or 32x32)
-                if name == "app_icon":
-                    img = img.resize((64, 64), Image.Resampling.LANCZOS) # Larger for app icon
-                else:
-                    img = img.resize((24, 24), Image.Resampling.LANCZOS)
-                self.icons[name] = ImageTk.PhotoImage(img)
-            except Exception as e:
-                print(f"Error loading icon {name}: {e}")
-                self.icons[name] = None # Or a default blank image if you have one
-                # messagebox.showwarning("Icon Missing", f"Could not load icon: {name}.png. Please ensure 'icon_generate.py' ran successfully.")
+        # Resize icons for buttons (24x24) and the window (64x64)
+        self.icons = _IconCache(icons_dir, sizes={"app_icon": (64, 64)}, default_size=(24, 24))
 
     def create_menu(self):
         """Creates the application's menu bar."""
@@ -142,7 +244,7 @@ class DownloaderApp:
         menubar.add_cascade(label="File", menu=file_menu)
         file_menu.add_command(label="Set Output Directory...", command=self.browse_output_directory)
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.master.quit)
+        file_menu.add_command(label="Exit", command=self._on_close)
 
         # Settings Menu
         settings_menu = tk.Menu(menubar, tearoff=0)
@@ -188,122 +290,151 @@ class DownloaderApp:
         """Changes the application's theme."""
         self.current_theme.set(theme_name)
         self.apply_styles()
-        self.save_settings()
+        self._mark_settings_dirty()
         self.log_message(f"Theme set to: {theme_name.capitalize()}", "info")
 
     def set_download_quality_option(self):
         """Sets the download quality in the download manager and saves settings."""
         quality = self.download_quality_var.get()
         self.download_manager.set_download_quality(quality)
-        self.save_settings()
+        self._mark_settings_dirty()
         self.log_message(f"Download quality set to: {quality.capitalize()}", "info")
 
 
+    def _get_theme(self, name):
+        """Returns the colors of the named theme, building them the first time they are needed."""
+        theme = self._theme_cache.get(name)
+        if theme is None:
+            theme = self._theme_cache[name] = _THEME_FACTORIES[name]()
+        return theme
+
+    def _build_style_spec(self, theme_colors):
+        """
+        Returns the ttk style settings for a theme as a list of (method, style, options)
+        entries, so switching themes only has to replay the table instead of rebuilding it.
+        """
+        return [
+            # General Frame and LabelFrame styles
+            ("configure", "TFrame", {"background": theme_colors.bg_frame}),
+            ("configure", "TLabelFrame", {"background": theme_colors.bg_frame, "foreground": theme_colors.text_primary,
+                                          "font": ("Segoe UI", 11, "bold"), "bordercolor": theme_colors.border, "relief": "flat"}),
+            ("map", "TLabelFrame", {"bordercolor": [("active", theme_colors.button_primary)]}),
+
+            # Label styles
+            ("configure", "TLabel", {"background": theme_colors.bg_frame, "foreground": theme_colors.text_primary, "font": ("Segoe UI", 10)}),
+
+            # Button styles with more rounded corners and subtle shadow
+            ("configure", "TButton", {
+                "font": ("Segoe UI", 10, "bold"),
+                "background": theme_colors.button_primary,
+                "foreground": theme_colors.text_light,
+                "relief": "flat",
+                "padding": [12, 6], # Slightly more padding
+                "focuscolor": "none",
+                "bordercolor": theme_colors.button_primary,
+                "focusthickness": 0,
+                # borderradius=8, # Tkinter ttk doesn't directly support borderradius for TButton
+            }),
+            ("map", "TButton", {
+                "background": [("active", theme_colors.button_hover), ("disabled", theme_colors.bg_accent)],
+                "foreground": [("active", theme_colors.text_light), ("disabled", theme_colors.text_primary)],
+                "relief": [("active", "raised"), ("!active", "flat")] # Subtle raised effect on hover
+            }),
+
+            # Entry and Combobox styles with more rounded corners
+            ("configure", "TEntry", {
+                "fieldbackground": theme_colors.input_bg,
+                "foreground": theme_colors.text_primary,
+                "bordercolor": theme_colors.border,
+                "relief": "solid",
+                "borderwidth": 1,
+                "padding": [8, 8], # More internal padding
+                "font": ("Segoe UI", 10),
+                # borderradius=8, # Tkinter ttk doesn't directly support borderradius for TEntry
+            }),
+            ("map", "TEntry", {"bordercolor": [("focus", theme_colors.button_primary)]}),
+
+            ("configure", "TCombobox", {
+                "fieldbackground": theme_colors.input_bg,
+                "foreground": theme_colors.text_primary,
+                "selectbackground": theme_colors.button_primary,
+                "selectforeground": theme_colors.text_light,
+                "bordercolor": theme_colors.border,
+                "relief": "solid",
+                "borderwidth": 1,
+                "padding": [8, 8], # More internal padding
+                "font": ("Segoe UI", 10),
+                # borderradius=8, # Tkinter ttk doesn't directly support borderradius for TCombobox
+            }),
+            ("map", "TCombobox", {
+                "fieldbackground": [("readonly", theme_colors.input_bg)],
+                "arrowcolor": [("!disabled", theme_colors.button_primary)],
+                "bordercolor": [("focus", theme_colors.button_primary)]
+            }),
+
+            # Radiobutton styles
+            ("configure", "TRadiobutton", {
+                "background": theme_colors.bg_frame,
+                "foreground": theme_colors.text_primary,
+                "font": ("Segoe UI", 10),
+                "indicatorcolor": theme_colors.button_primary,
+                "selectcolor": theme_colors.button_primary,
+                "focusthickness": 0,
+                "padding": [5, 5] # Add some padding around text
+            }),
+            ("map", "TRadiobutton", {
+                "background": [("active", theme_colors.bg_accent)],
+                "foreground": [("active", theme_colors.text_primary)]
+            }),
+
+            # Progressbar styles with more visual depth
+            ("configure", "TProgressbar", {
+                "background": theme_colors.success,
+                "troughcolor": theme_colors.bg_accent,
+                "bordercolor": theme_colors.border,
+                "thickness": 20, # Thicker progress bar
+                "relief": "flat",
+                # borderradius=10, # Tkinter ttk doesn't directly support borderradius for TProgressbar
+            }),
+        ]
+
     def apply_styles(self):
         """Applies modern and appealing styles to Tkinter widgets."""
-        theme_colors = self.themes[self.current_theme.get()]
-        style = ttk.Style()
-        style.theme_use("clam") # A modern theme that allows customization
+        theme_name = self.current_theme.get()
+        theme_colors = self._get_theme(theme_name)
+        if self._style is None:
+            # The theme and the progress bar layout don't depend on the colors, so set them once
+            self._style = ttk.Style()
+            self._style.theme_use("clam") # A modern theme that allows customization
+            self._style.layout("TProgressbar",
+                               [('progressbar.trough', {'children':
+                                 [('progressbar.pbar', {'side': 'left', 'sticky': 'ns'})],
+                                 'sticky': 'nswe'})]) # Ensures pbar fills trough
 
         # Apply main window background
-        self.master.configure(bg=theme_colors["bg_app"])
-
-        # General Frame and LabelFrame styles
-        style.configure("TFrame", background=theme_colors["bg_frame"])
-        style.configure("TLabelFrame", background=theme_colors["bg_frame"], foreground=theme_colors["text_primary"],
-                        font=("Segoe UI", 11, "bold"), bordercolor=theme_colors["border"], relief="flat")
-        style.map("TLabelFrame", bordercolor=[("active", theme_colors["button_primary"])])
-
-        # Label styles
-        style.configure("TLabel", background=theme_colors["bg_frame"], foreground=theme_colors["text_primary"], font=("Segoe UI", 10))
-
-        # Button styles with more rounded corners and subtle shadow
-        style.configure("TButton",
-                        font=("Segoe UI", 10, "bold"),
-                        background=theme_colors["button_primary"],
-                        foreground=theme_colors["text_light"],
-                        relief="flat",
-                        padding=[12, 6], # Slightly more padding
-                        focuscolor="none",
-                        bordercolor=theme_colors["button_primary"],
-                        focusthickness=0,
-                        # borderradius=8, # Tkinter ttk doesn't directly support borderradius for TButton
-                       )
-        style.map("TButton",
-                  background=[("active", theme_colors["button_hover"]), ("disabled", theme_colors["bg_accent"])],
-                  foreground=[("active", theme_colors["text_light"]), ("disabled", theme_colors["text_primary"])],
-                  relief=[("active", "raised"), ("!active", "flat")] # Subtle raised effect on hover
-                 )
-        
-        # Entry and Combobox styles with more rounded corners
-        style.configure("TEntry",
-                        fieldbackground=theme_colors["input_bg"],
-                        foreground=theme_colors["text_primary"],
-                        bordercolor=theme_colors["border"],
-                        relief="solid",
-                        borderwidth=1,
-                        padding=[8, 8], # More internal padding
-                        font=("Segoe UI", 10),
-                        # borderradius=8, # Tkinter ttk doesn't directly support borderradius for TEntry
-                       )
-        style.map("TEntry",
-                  bordercolor=[("focus", theme_colors["button_primary"])]
-                 )
-
-        style.configure("TCombobox",
-                        fieldbackground=theme_colors["input_bg"],
-                        foreground=theme_colors["text_primary"],
-                        selectbackground=theme_colors["button_primary"],
-                        selectforeground=theme_colors["text_light"],
-                        bordercolor=theme_colors["border"],
-                        relief="solid",
-                        borderwidth=1,
-                        padding=[8, 8], # More internal padding
-                        font=("Segoe UI", 10),
-                        # borderradius=8, # Tkinter ttk doesn't directly support borderradius for TCombobox
-                       )
-        style.map("TCombobox",
-                  fieldbackground=[("readonly", theme_colors["input_bg"])],
-                  arrowcolor=[("!disabled", theme_colors["button_primary"])],
-                  bordercolor=[("focus", theme_colors["button_primary"])]
-                 )
-
-        # Radiobutton styles
-        style.configure("TRadiobutton",
-                        background=theme_colors["bg_frame"],
-                        foreground=theme_colors["text_primary"],
-                        font=("Segoe UI", 10),
-                        indicatorcolor=theme_colors["button_primary"],
-                        selectcolor=theme_colors["button_primary"],
-                        focusthickness=0,
-                        padding=[5, 5] # Add some padding around text
-                       )
-        style.map("TRadiobutton",
-                  background=[("active", theme_colors["bg_accent"])],
-                  foreground=[("active", theme_colors["text_primary"])]
-                 )
-
-        # Progressbar styles with more visual depth
-        style.configure("TProgressbar",
-                        background=theme_colors["success"],
-                        troughcolor=theme_colors["bg_accent"],
-                        bordercolor=theme_colors["border"],
-                        thickness=20, # Thicker progress bar
-                        relief="flat",
-                        # borderradius=10, # Tkinter ttk doesn't directly support borderradius for TProgressbar
-                       )
-        style.layout("TProgressbar",
-                     [('progressbar.trough', {'children':
-                       [('progressbar.pbar', {'side': 'left', 'sticky': 'ns'})],
-                       'sticky': 'nswe'})]) # Ensures pbar fills trough
+        self.master.configure(bg=theme_colors.bg_app)
+
+        # Only send Tk the options that differ from what is already applied, collected into
+        # {style: {"configure": {...}, "map": {...}}} so they go to Tcl as a single script
+        spec = self._style_specs.get(theme_name)
+        if spec is None:
+            spec = self._style_specs[theme_name] = self._build_style_spec(theme_colors)
+        settings = {}
+        for method, style_name, options in spec:
+            applied = self._applied_spec.setdefault((method, style_name), {})
+            changed = {option: value for option, value in options.items() if applied.get(option) != value}
+            if changed:
+                settings.setdefault(style_name, {})[method] = changed
+                applied.update(changed)
+        if settings:
+            self._style.theme_settings("clam", settings)
 
         # Text widget styling (for log output)
-        self.log_text.config(bg=theme_colors["log_bg"], fg=theme_colors["text_primary"])
-        self.log_text.tag_configure("info", foreground=theme_colors["text_primary"])
-        self.log_text.tag_configure("success", foreground=theme_colors["success"])
-        self.log_text.tag_configure("error", foreground=theme_colors["error"])
-        self.log_text.tag_configure("progress", foreground=theme_colors["button_primary"])
-
+        self.log_text.config(bg=theme_colors.log_bg, fg=theme_colors.text_primary)
+        self.log_text.tag_configure("info", foreground=theme_colors.text_primary)
+        self.log_text.tag_configure("success", foreground=theme_colors.success)
+        self.log_text.tag_configure("error", foreground=theme_colors.error)
+        self.log_text.tag_configure("progress", foreground=theme_colors.button_primary)
 
     def create_widgets(self):
         """Creates and lays out the GUI widgets."""
@@ -360,6 +491,9 @@ class DownloaderApp:
 
         self.progress_label = ttk.Label(progress_frame, text="Waiting for download...")
         self.progress_label.pack(pady=8) # Increased pady
+        # Bound once for _update_progress_gui, which runs for every drawn progress report
+        self._pbar_config = self.progress_bar.config
+        self._plabel_config = self.progress_label.config
 
         # Log Output Section
         log_frame = ttk.LabelFrame(main_frame, text="Download Log", padding="20 20") # Increased padding
@@ -394,10 +528,10 @@ class DownloaderApp:
             self.output_dir_entry.insert(0, self.output_directory)
             self.output_dir_entry.config(state="readonly")
             self.log_message(f"Output directory set to: {self.output_directory}", "info")
-            self.save_settings() # Save updated output directory
+            self._mark_settings_dirty() # Save updated output directory
 
     def start_download(self):
-        """Initiates the download process in a separate thread."""
+        """Queues the download on the download manager's worker threads."""
         url = self.url_entry.get().strip()
         download_type = self.download_type.get()
 
@@ -417,62 +551,82 @@ class DownloaderApp:
         self.progress_label.config(text="Starting download...")
         self.download_button.config(state="disabled") # Disable button during download
 
-        # Start download in a thread
-        self.download_manager.download_content(url, download_type, self.output_directory)
+        future = self.download_manager.download_content(url, download_type, self.output_directory)
+        if future is not None: # Rejected downloads already reported through on_download_error
+            future.add_done_callback(self._on_download_future_done)
+
+    def _on_download_future_done(self, future):
+        """Reports downloads that were cancelled or failed outside the manager's own error handling."""
+        # Usually runs on a download worker thread, so it only queues work for the GUI
+        if future.cancelled():
+            self._gui_queue.put_nowait((self._on_download_error_gui, "Download cancelled."))
+        elif future.exception() is not None:
+            self._gui_queue.put_nowait((self._on_download_error_gui, str(future.exception())))
 
     def update_progress(self, d):
         """Updates the GUI with download progress."""
-        # This method is called from a background thread, so use master.after to update GUI
-        self.master.after(10, self._update_progress_gui, d)
+        # Called from a background thread. The download manager reuses the dict for later
+        # reports, which is fine: the pump only ever draws the newest state of it.
+        self._gui_queue.put_nowait((self._update_progress_gui, d))
+
+    def _pump_gui_queue(self):
+        """Runs the GUI handlers queued by the download threads since the last tick, then reschedules itself (~30 Hz)."""
+        try:
+            progress = None
+            while True:
+                try:
+                    handler, arg = self._gui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if handler == self._update_progress_gui:
+                    progress = arg # Only the newest report of a batch is worth drawing
+                else:
+                    progress = None # Completion and errors supersede any report queued before them
+                    handler(arg)
+            if progress is not None:
+                self._update_progress_gui(progress)
+            if self._log_buffer:
+                self._flush_log()
+        finally:
+            # Keep pumping even if a handler failed, or nothing would reach the GUI again
+            self.master.after(33, self._pump_gui_queue)
 
     def _update_progress_gui(self, d):
         """Helper to safely update GUI elements from the main thread."""
+        get = d.get # Bound once; the downloading branch reads up to eight keys
         if d['status'] == 'downloading':
-            total_bytes = d.get('total_bytes') or d.get('total_bytes_estimate', 0)
-            downloaded_bytes = d.get('downloaded_bytes', 0)
+            total_bytes = get('total_bytes') or get('total_bytes_estimate') or 0
+            downloaded_bytes = get('downloaded_bytes') or 0
 
             # Safely get formatted strings, providing defaults if not present
-            percent_str = d.get('_percent_str', 'N/A')
-            total_bytes_str = d.get('_total_bytes_str', 'N/A')
-            speed_str = d.get('_speed_str', 'N/A')
-            eta_str = d.get('_eta_str', 'N/A')
-            downloaded_bytes_str = d.get('_downloaded_bytes_str', 'N/A') # Ensure this key is handled
+            percent_str = get('_percent_str', 'N/A')
+            total_bytes_str = get('_total_bytes_str', 'N/A')
+            speed_str = get('_speed_str', 'N/A')
+            eta_str = get('_eta_str', 'N/A')
+            downloaded_bytes_str = get('_downloaded_bytes_str', 'N/A') # Ensure this key is handled
 
             if total_bytes > 0:
                 percent = (downloaded_bytes / total_bytes) * 100
-                self.progress_bar.config(mode="determinate", value=percent)
-                self.progress_label.config(text=f"Downloading: {percent_str} of {total_bytes_str} at {speed_str} ETA {eta_str}")
+                self._pbar_config(mode="determinate", value=percent)
+                self._plabel_config(text=f"Downloading: {percent_str} of {total_bytes_str} at {speed_str} ETA {eta_str}")
             else:
-                self.progress_bar.config(mode="indeterminate") # Fallback to indeterminate if total size unknown
-                self.progress_label.config(text=f"Downloading: {downloaded_bytes_str} at {speed_str} ETA {eta_str}")
+                self._pbar_config(mode="indeterminate") # Fallback to indeterminate if total size unknown
+                self._plabel_config(text=f"Downloading: {downloaded_bytes_str} at {speed_str} ETA {eta_str}")
             
-            # Log progress updates less frequently to avoid overwhelming the log
-            # Use a more robust check for percent_str to avoid errors if it's 'N/A'
-            try:
-                # Extract numeric part, handle potential non-numeric values
-                numeric_percent = float(percent_str.replace('%', '').split('.')[0])
-                current_percent = int(numeric_percent)
-                if current_percent % 10 == 0 and current_percent != self._last_logged_percent:
-                     self.log_message(f"Progress: {percent_str}", "progress")
-                     self._last_logged_percent = current_percent
-            except ValueError:
-                # Handle cases where percent_str is not a valid number (e.g., 'N/A' or during initial setup)
-                pass
-
-
-        elif d['status'] == 'finished':
-            self.progress_bar.config(value=100, mode="determinate")
-            self.progress_label.config(text="Download complete, processing...")
-            self.log_message("Download finished. Post-processing...", "info")
-        elif d['status'] == 'error':
-            self.progress_bar.config(value=0, mode="determinate")
-            self.progress_label.config(text="Download failed.")
-            self.log_message("Download failed.", "error")
+            # Log progress updates less frequently to avoid overwhelming the log: once per 10% step,
+            # computed from the byte counts rather than by parsing percent_str
+            if total_bytes > 0:
+                current_percent = int(downloaded_bytes * 10 // total_bytes) * 10 # Estimates are often floats
+                if current_percent != self._last_logged_percent:
+                    self.log_message(f"Progress: {current_percent}%", "progress")
+                    self._last_logged_percent = current_percent
+        # 'finished' and 'error' reports are left to on_download_complete/on_download_error,
+        # which always follow them and own the terminal state of the GUI
 
 
     def on_download_complete(self, message):
         """Handles download completion."""
-        self.master.after(10, self._on_download_complete_gui, message)
+        self._gui_queue.put_nowait((self._on_download_complete_gui, message))
 
     def _on_download_complete_gui(self, message):
         """Helper to safely handle completion in the main thread."""
@@ -485,7 +639,7 @@ class DownloaderApp:
 
     def on_download_error(self, message):
         """Handles download errors."""
-        self.master.after(10, self._on_download_error_gui, message)
+        self._gui_queue.put_nowait((self._on_download_error_gui, message))
 
     def _on_download_error_gui(self, message):
         """Helper to safely handle errors in the main thread."""
@@ -497,9 +651,24 @@ class DownloaderApp:
         self._last_logged_percent = -1 # Reset for next download
 
     def log_message(self, message, tag="info"):
-        """Appends a message to the log Text widget."""
+        """Queues a message for the log Text widget; the GUI pump writes it on its next tick."""
+        self._log_buffer.append((message + "\n", tag))
+
+    def _flush_log(self):
+        """Writes all buffered log lines with one insert per run of same-tag lines and a single scroll."""
         self.log_text.config(state="normal")
-        self.log_text.insert(tk.END, message + "\n", tag)
+        lines, run_tag = [], None
+        while self._log_buffer:
+            line, tag = self._log_buffer.popleft()
+            if tag != run_tag and lines:
+                self.log_text.insert(tk.END, "".join(lines), run_tag)
+                lines = []
+            lines.append(line)
+            run_tag = tag
+        self.log_text.insert(tk.END, "".join(lines), run_tag)
+        line_count = int(self.log_text.index("end-1c").split(".")[0])
+        if line_count > MAX_LOG_LINES:
+            self.log_text.delete("1.0", f"{line_count - MAX_LOG_LINES}.0")
         self.log_text.see(tk.END) # Auto-scroll to the end
         self.log_text.config(state="disabled")
 